@@ -5,6 +5,7 @@ import torch.nn.functional as F
 from torch import optim, Tensor
 from torch.optim import Optimizer
 from torch.utils.data import DataLoader
+from torch.utils.data.distributed import DistributedSampler
 from tqdm import tqdm
 
 import config
@@ -32,6 +33,23 @@ class Classifier(torch.nn.Module):
         A classifier which the network inherits from, defines standard training and evaluating functions
     """
 
+    def to_distributed(self) -> "Classifier":
+        """
+            Wrap the model in DistributedDataParallel so gradients are
+            all-reduced across ranks during backward; forward passes made by
+            step go through the wrapper while the model itself keeps its
+            state_dict and training API
+
+            :return: self
+        """
+        ddp = torch.nn.parallel.DistributedDataParallel(
+            self, device_ids=[config.DEVICE], gradient_as_bucket_view=True,
+            find_unused_parameters=False)
+        # Bypass Module.__setattr__ so the wrapper is not registered as a
+        # submodule of the model it wraps
+        object.__setattr__(self, '_ddp', ddp)
+        return self
+
     def step(self, data: Dict[str, Tensor]) -> Tuple[Tensor, float, Tensor, Tensor]:
         """
             Pass input through model and calculate loss and accuracy
@@ -42,7 +60,9 @@ class Classifier(torch.nn.Module):
         """
         vision, audio, text, context, speaker, labels = extract_data(data)
 
-        output = self(text, vision, audio, speaker, context)
+        # Prefer the DDP wrapper (gradient sync), then the compiled forward
+        model = getattr(self, '_ddp', None) or getattr(self, '_compiled_forward', None) or self
+        output = model(text, vision, audio, speaker, context)
         acc = accuracy(output, labels)
         loss = F.cross_entropy(output, labels.squeeze())
         return loss, acc, output, labels
@@ -66,6 +86,10 @@ class Classifier(torch.nn.Module):
 
         for epoch in range(config.EPOCHS):
 
+            # Reseed the distributed shards so each epoch shuffles differently
+            if isinstance(train_loader.sampler, DistributedSampler):
+                train_loader.sampler.set_epoch(epoch)
+
             with tqdm(train_loader) as td:
                 for batch_data in td:
                     optimizer.zero_grad()
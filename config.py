@@ -65,6 +65,10 @@ SPEAKER_INIT_WEIGHT = 1.0
 global POST_FUSION_DIM
 POST_FUSION_DIM = 32
 
+global COMPILE_MODE
+# torch.compile mode for the fusion network, None disables compilation
+COMPILE_MODE = 'reduce-overhead'
+
 global LEARNING_RATE
 LEARNING_RATE = 5e-4
 
@@ -6,6 +6,7 @@ import numpy as np
 from h5py import File
 from sklearn.model_selection import StratifiedKFold
 from torch.utils.data import DataLoader
+from torch.utils.data.distributed import DistributedSampler
 
 import config
 from Textual.TextEncoding import get_bert_encoding, get_context_bert_encoding
@@ -60,12 +61,14 @@ class MultiModalDataLoader:
                  ))
             self.data_output.append(int(self.dataset_json[ID]["sarcasm"]))
 
-    def get_data_loader(self, train_ind_si: List[int], author_ind: Dict[str, int]) -> DataLoader:
+    def get_data_loader(self, train_ind_si: List[int], author_ind: Dict[str, int],
+                        distributed: bool = False) -> DataLoader:
         """
         Get Data Loader for a specific set of indices
 
         :param train_ind_si: Array of indices for train data
         :param author_ind: Dictionary of all speakers and their corresponding indices
+        :param distributed: Shard the data across ranks with a DistributedSampler
 
         :return: Dataloader for specific set of indices in data input from dataset
         """
@@ -103,4 +106,8 @@ class MultiModalDataLoader:
         train_dataset = MultiModalDataset(train_text_feature, train_video_feature_mean,
                                           train_audio_feature, speaker_feature, context_feature, train_out)
 
+        if distributed:
+            return DataLoader(train_dataset, batch_size=config.BATCH_SIZE,
+                              sampler=DistributedSampler(train_dataset))
+
         return DataLoader(train_dataset, batch_size=config.BATCH_SIZE, shuffle=True)
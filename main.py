@@ -1,19 +1,39 @@
 import json
+import os
 
 import numpy as np
 import torch
+import torch.distributed as dist
 from sklearn.metrics import classification_report, confusion_matrix
 
 import config
 from data_loader import MultiModalDataLoader
 from network import WeightedMultiModalFusionNetwork
 from results import Result, IterationResults
-from utils import get_author_ind
+from utils import get_author_ind, is_main_process
+
+
+def init_distributed() -> bool:
+    """
+    Initialise the NCCL process group when launched with torchrun, pinning
+    each rank to its local GPU
+
+    :return: True when running distributed, False for single-process runs
+    """
+    if int(os.environ.get('WORLD_SIZE', 1)) < 2:
+        return False
+
+    dist.init_process_group('nccl')
+    local_rank = int(os.environ['LOCAL_RANK'])
+    torch.cuda.set_device(local_rank)
+    config.DEVICE = torch.device('cuda', local_rank)
+    return True
 
 
 def k_fold_cross_validation():
     dataloader_gen = MultiModalDataLoader()
     iteration_results = IterationResults()
+    distributed = dist.is_available() and dist.is_initialized()
 
     for fold, (train_index, test_index) in enumerate(dataloader_gen.split_indices):
         print('-' * 25, " Fold ", fold, '-' * 25)
@@ -21,16 +41,24 @@ def k_fold_cross_validation():
         author_ind = get_author_ind(train_index, dataloader_gen.data_input)
         speakers_num = len(author_ind)
 
-        train_loader = dataloader_gen.get_data_loader(train_index, author_ind)
+        # Only the train set is sharded across ranks; every rank evaluates
+        # the full validation / test folds so the reported metrics agree
+        train_loader = dataloader_gen.get_data_loader(train_index, author_ind, distributed=distributed)
         val_loader = dataloader_gen.get_data_loader(test_index, author_ind)
         test_loader = dataloader_gen.get_data_loader(test_index, author_ind)
 
         # Initialize the model and move to the device
         model = WeightedMultiModalFusionNetwork(speakers_num)
         model = model.to(config.DEVICE)
+        if distributed:
+            model.to_distributed()
 
         best_result = model.fit(train_loader, val_loader)
 
+        # Only rank 0 writes the checkpoint; wait for it before loading
+        if distributed:
+            dist.barrier()
+
         model.load_state_dict(torch.load(config.MODEL_PATH)['model_state_dict'])
         model.to(config.DEVICE)
 
@@ -51,12 +79,18 @@ def k_fold_cross_validation():
 
 
 def main():
+    init_distributed()
     five_results = []
 
     for i in range(5):
         iteration_results = k_fold_cross_validation()
-        tmp_dict = iteration_results.print_result()
-        five_results.append(tmp_dict)
+        # Every rank trains, but only rank 0 reports and writes shared files
+        if is_main_process():
+            tmp_dict = iteration_results.print_result()
+            five_results.append(tmp_dict)
+
+    if not is_main_process():
+        return
 
     avg_precision = np.mean([result['precision'] for result in five_results])
     avg_recall = np.mean([result['recall'] for result in five_results])
@@ -1,3 +1,7 @@
+import copy
+import subprocess
+from typing import Tuple
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
@@ -6,6 +10,148 @@ from torch import Tensor
 import config
 from classifier import Classifier
 
+# Let FP32 matmuls route through TF32 Tensor Cores on Ampere+ GPUs
+torch.set_float32_matmul_precision('high')
+
+# Let Inductor's post-grad pass batch the subnets' independent small linears
+# into grouped matmuls under torch.compile; the per-modality widths are too
+# uneven (inputs 283-2048, hiddens 4-128) for a manually padded bmm to pay off
+try:
+    import torch._inductor.config
+
+    torch._inductor.config.post_grad_fusion_options["batch_linear"] = {}
+except (ImportError, AttributeError):
+    pass
+
+
+@torch.jit.script
+def _bn_drop_linear_relu(x: Tensor, running_mean: Tensor, running_var: Tensor,
+                         bn_weight: Tensor, bn_bias: Tensor, momentum: float, eps: float,
+                         p: float, training: bool, w_lin: Tensor, b_lin: Tensor) -> Tensor:
+    """
+        Run batch norm, dropout and the first Linear + ReLU of a SubNet as one
+        TorchScript graph - the training-mode counterpart of the folded eval
+        path, saving the separate norm and dropout kernel launches
+
+        :param x: A tensor holding the raw subnet input
+        :param running_mean: batch norm running mean
+        :param running_var: batch norm running variance
+        :param bn_weight: batch norm gamma
+        :param bn_bias: batch norm beta
+        :param momentum: batch norm running-stats momentum
+        :param eps: batch norm epsilon
+        :param p: dropout probability
+        :param training: whether the module is in training mode
+        :param w_lin: linear_1 weight
+        :param b_lin: linear_1 bias
+
+        :return: A tensor containing the output of the first fused block
+    """
+    y = F.batch_norm(x, running_mean, running_var, bn_weight, bn_bias, training, momentum, eps)
+    y = F.dropout(y, p, training)
+    return F.relu(F.linear(y, w_lin, b_lin))
+
+
+@torch.jit.script
+def _linear_relu_tail(x: Tensor, w_2: Tensor, b_2: Tensor, w_3: Tensor, b_3: Tensor) -> Tensor:
+    """
+        Run the last two Linear + ReLU blocks of a SubNet as one TorchScript
+        graph, continuing from the fused first block
+
+        :param x: A tensor holding the output of the first fused block
+        :param w_2: linear_2 weight
+        :param b_2: linear_2 bias
+        :param w_3: linear_3 weight
+        :param b_3: linear_3 bias
+
+        :return: A tensor containing the output of the three layers
+    """
+    y = F.relu(F.linear(x, w_2, b_2))
+    return F.relu(F.linear(y, w_3, b_3))
+
+
+@torch.jit.script
+def _drop_linear_relu(x: Tensor, p: float, training: bool, w: Tensor, b: Tensor) -> Tensor:
+    """
+        Run dropout, a linear layer and ReLU as one TorchScript graph so the
+        dropout mask apply fuses with the matmul instead of dispatching its
+        own kernel and mask allocation
+
+        :param x: A tensor holding the block input
+        :param p: dropout probability
+        :param training: whether the module is in training mode
+        :param w: linear weight
+        :param b: linear bias
+
+        :return: A tensor containing the block output
+    """
+    return F.relu(F.linear(F.dropout(x, p, training), w, b))
+
+
+@torch.jit.script
+def _drop_add3_linear_relu(x: Tensor, speaker: Tensor, context: Tensor, p: float, training: bool,
+                           w_x: Tensor, b_x: Tensor, w_speaker: Tensor, w_context: Tensor) -> Tensor:
+    """
+        Run the split late-fusion layer as one TorchScript graph - dropout on
+        each source, the three summed linears and the ReLU
+
+        :param x: A tensor holding the post-fusion activations
+        :param speaker: A tensor holding the speaker hidden representation
+        :param context: A tensor holding the context hidden representation
+        :param p: dropout probability
+        :param training: whether the module is in training mode
+        :param w_x: post-fusion linear weight
+        :param b_x: post-fusion linear bias
+        :param w_speaker: speaker linear weight
+        :param w_context: context linear weight
+
+        :return: A tensor containing the fused late-fusion output
+    """
+    y = F.linear(F.dropout(x, p, training), w_x, b_x) \
+        + F.linear(F.dropout(speaker, p, training), w_speaker) \
+        + F.linear(F.dropout(context, p, training), w_context)
+    return F.relu(y)
+
+
+@torch.jit.script
+def _drop_linear(x: Tensor, p: float, training: bool, w: Tensor, b: Tensor) -> Tensor:
+    """
+        Run dropout followed by a linear layer as one TorchScript graph,
+        used for the final classification layer
+
+        :param x: A tensor holding the block input
+        :param p: dropout probability
+        :param training: whether the module is in training mode
+        :param w: linear weight
+        :param b: linear bias
+
+        :return: A tensor containing the block output
+    """
+    return F.linear(F.dropout(x, p, training), w, b)
+
+
+@torch.jit.script
+def _linear_relu_mlp(x: Tensor, w_1: Tensor, b_1: Tensor, w_2: Tensor, b_2: Tensor,
+                     w_3: Tensor, b_3: Tensor) -> Tensor:
+    """
+        Run the three Linear + ReLU blocks of a SubNet as one TorchScript
+        graph so the fuser can merge the elementwise ReLUs into the matmuls
+        instead of dispatching six separate ops
+
+        :param x: A tensor holding the normalised, dropped-out subnet input
+        :param w_1: linear_1 weight
+        :param b_1: linear_1 bias
+        :param w_2: linear_2 weight
+        :param b_2: linear_2 bias
+        :param w_3: linear_3 weight
+        :param b_3: linear_3 bias
+
+        :return: A tensor containing the output of the three layers
+    """
+    y = F.relu(F.linear(x, w_1, b_1))
+    y = F.relu(F.linear(y, w_2, b_2))
+    return F.relu(F.linear(y, w_3, b_3))
+
 
 class ModalityFusion(nn.Module):
     """
@@ -22,6 +168,45 @@ class ModalityFusion(nn.Module):
         self.weight_1 = nn.Parameter(torch.ones(1))
         self.weight_2 = nn.Parameter(torch.ones(1))
         self.weight_3 = nn.Parameter(torch.ones(1))
+        self._buf = None
+        self._buf_key = None
+
+    def _get_buf(self, batch_size: int, fused_size: int, dtype: torch.dtype, device: torch.device) -> Tensor:
+        """
+            Fetch the cached fused output buffer, reallocating only when the
+            batch size, dtype or device of the inputs changes
+
+            :param batch_size: Number of samples in the current batch
+            :param fused_size: Combined width of the three modalities
+            :param dtype: dtype of the input tensors
+            :param device: device of the input tensors
+
+            :return: A (batch_size, fused_size) tensor to write the fused output into
+        """
+        key = (batch_size, dtype, device)
+        if self._buf_key != key:
+            # torch.empty gives a contiguous buffer, so the downstream
+            # post-fusion matmul reads it through the fast BLAS path
+            self._buf = torch.empty(batch_size, fused_size, dtype=dtype, device=device)
+            self._buf_key = key
+        return self._buf
+
+    def scale_vector(self, text_size: int, audio_size: int, video_size: int) -> Tensor:
+        """
+            Expand the three scalar modality weights into one per-column scale
+            vector matching the fused layout, so the scalars can be baked into
+            the columns of the consuming linear's weight instead of multiplying
+            the full activations
+
+            :param text_size: Width of the textual modality
+            :param audio_size: Width of the audio modality
+            :param video_size: Width of the video modality
+
+            :return: A (text_size + audio_size + video_size,) scale tensor
+        """
+        return torch.cat([self.weight_1.expand(text_size),
+                          self.weight_2.expand(audio_size),
+                          self.weight_3.expand(video_size)])
 
     def forward(self, text: Tensor, audio: Tensor, video: Tensor) -> Tensor:
         """
@@ -33,11 +218,20 @@ class ModalityFusion(nn.Module):
 
             :return: A tensor containing the concatenated / fused output of the three input modalities
         """
-        text_w = text * self.weight_1
-        audio_w = audio * self.weight_2
-        video_w = video * self.weight_3
+        if torch.is_grad_enabled():
+            # Writing into a pre-allocated buffer is illegal under autograd,
+            # so the training path keeps the allocating cat
+            return torch.cat([text, audio, video], -1)
+
+        text_size = text.shape[-1]
+        audio_size = audio.shape[-1]
+        video_size = video.shape[-1]
 
-        return torch.cat([text_w, audio_w, video_w], -1)
+        out = self._get_buf(text.shape[0], text_size + audio_size + video_size, text.dtype, text.device)
+        out[:, :text_size].copy_(text)
+        out[:, text_size:text_size + audio_size].copy_(audio)
+        out[:, text_size + audio_size:].copy_(video)
+        return out
 
 
 class SubNet(nn.Module):
@@ -56,6 +250,39 @@ class SubNet(nn.Module):
         self.linear_2 = nn.Linear(hidden_size, hidden_size)
         self.linear_3 = nn.Linear(hidden_size, hidden_size)
 
+        # linear_1 with the eval-mode batch norm affine folded in, rebuilt on
+        # every switch to eval and discarded on the switch back to train
+        self._folded_weight = None
+        self._folded_bias = None
+
+    def train(self, mode: bool = True) -> "SubNet":
+        """
+            Switch between train and eval mode, folding the batch norm into
+            linear_1 on the way into eval so inference skips the norm kernel
+
+            :param mode: True for train mode, False for eval mode
+
+            :return: self
+        """
+        super(SubNet, self).train(mode)
+        if mode:
+            self._folded_weight = None
+            self._folded_bias = None
+        else:
+            self._fold_norm()
+        return self
+
+    def _fold_norm(self) -> None:
+        """
+            Fold the eval-mode batch norm affine (x - mean) / std * gamma + beta
+            into linear_1's weight and bias
+        """
+        with torch.no_grad():
+            scale = self.norm.weight / torch.sqrt(self.norm.running_var + self.norm.eps)
+            shift = self.norm.bias - self.norm.running_mean * scale
+            self._folded_weight = self.linear_1.weight * scale
+            self._folded_bias = self.linear_1.bias + torch.mv(self.linear_1.weight, shift)
+
     def forward(self, x: Tensor) -> Tensor:
         """
             Read the bert text embeddings
@@ -64,12 +291,54 @@ class SubNet(nn.Module):
 
             :return: A tensor containing the output of the three layers
         """
-        normed = self.norm(x)
-        dropped = self.drop(normed)
-        y_1 = F.relu(self.linear_1(dropped))
-        y_2 = F.relu(self.linear_2(y_1))
-        y_3 = F.relu(self.linear_3(y_2))
-        return y_3
+        # Upstream slicing can hand over non-contiguous inputs, which knocks
+        # the batch norm and matmuls off their vectorized paths
+        if not x.is_contiguous():
+            x = x.contiguous()
+
+        # The folded params are built under no_grad, so the folded branch must
+        # never serve a backward pass - fit leaves the model in eval mode
+        # between epochs, and taking this path there would cut linear_1 and
+        # the norm affine out of the autograd graph (and trip DDP's reducer)
+        if not self.training and not torch.is_grad_enabled() and self._folded_weight is not None:
+            # Dropout is the identity in eval mode and the norm is folded into
+            # linear_1, so the whole subnet is just the three linear layers
+            return _linear_relu_mlp(x,
+                                    self._folded_weight, self._folded_bias,
+                                    self.linear_2.weight, self.linear_2.bias,
+                                    self.linear_3.weight, self.linear_3.bias)
+
+        y_1 = _bn_drop_linear_relu(x, self.norm.running_mean, self.norm.running_var,
+                                   self.norm.weight, self.norm.bias,
+                                   self.norm.momentum, self.norm.eps,
+                                   self.drop.p, self.training,
+                                   self.linear_1.weight, self.linear_1.bias)
+        return _linear_relu_tail(y_1,
+                                 self.linear_2.weight, self.linear_2.bias,
+                                 self.linear_3.weight, self.linear_3.bias)
+
+    def to_inference_mlp(self) -> nn.Sequential:
+        """
+            Produce a plain eval-only copy of the subnet as a Sequential of
+            Linear + ReLU modules - the batch norm is folded into the first
+            linear and dropout (the identity in eval mode) is dropped,
+            leaving a module-call graph that TorchScript and dynamic
+            quantization can both consume
+
+            :return: An eval-mode Sequential equivalent of this subnet
+        """
+        self._fold_norm()
+        # Match linear_1's placement so the copy is not left on the default
+        # CPU device when the trained subnet lives on GPU
+        folded = nn.Linear(self.linear_1.in_features, self.linear_1.out_features,
+                           device=self.linear_1.weight.device, dtype=self.linear_1.weight.dtype)
+        with torch.no_grad():
+            folded.weight.copy_(self._folded_weight)
+            folded.bias.copy_(self._folded_bias)
+
+        return nn.Sequential(folded, nn.ReLU(),
+                             copy.deepcopy(self.linear_2), nn.ReLU(),
+                             copy.deepcopy(self.linear_3), nn.ReLU()).eval()
 
 
 class WeightedMultiModalFusionNetwork(Classifier):
@@ -98,10 +367,207 @@ class WeightedMultiModalFusionNetwork(Classifier):
 
         self.post_fusion_layer_2 = nn.Linear(config.POST_FUSION_DIM, config.POST_FUSION_DIM)
 
-        self.post_fusion_layer_3 = nn.Linear(config.POST_FUSION_DIM + config.SPEAKER_HIDDEN + config.CONTEXT_HIDDEN,
-                                             config.POST_FUSION_DIM)
+        # Linear(cat([x, speaker, context])) == Lin_x(x) + Lin_s(speaker) + Lin_c(context),
+        # split into three linears so the concatenated tensor never materializes
+        self.post_fusion_layer_3 = nn.Linear(config.POST_FUSION_DIM, config.POST_FUSION_DIM)
+        self.post_fusion_layer_3_speaker = nn.Linear(config.SPEAKER_HIDDEN, config.POST_FUSION_DIM, bias=False)
+        self.post_fusion_layer_3_context = nn.Linear(config.CONTEXT_HIDDEN, config.POST_FUSION_DIM, bias=False)
         self.fc = nn.Linear(config.POST_FUSION_DIM, 2)
 
+        # One stream per subnet, created on first CUDA forward
+        self._streams = None
+
+        # Collapse the chain of small kernels (subnets, fusion, post-fusion
+        # linears) into a few fused Inductor kernels; the stream dispatch in
+        # _run_subnets causes a graph break so fullgraph stays off.
+        # speaker_num is fixed per dataset fold and the feature widths come
+        # from config, so dynamic=False lets Inductor specialize on static
+        # shapes and skip the dynamic-shape guards on these small tensors.
+        # The wrapper lives on its own attribute, dispatched from
+        # Classifier.step, so self.forward stays the plain method and
+        # tracing-based paths (ONNX export, scripting, deepcopies) never
+        # run into the dynamo wrapper
+        self._compiled_forward = None
+        if config.COMPILE_MODE is not None and hasattr(torch, 'compile'):
+            self._compiled_forward = torch.compile(self.forward, mode=config.COMPILE_MODE, dynamic=False)
+
+    def _run_subnets(self, text_x: Tensor, video_x: Tensor, audio_x: Tensor,
+                     speaker_x: Tensor, context_x: Tensor) -> Tuple[Tensor, Tensor, Tensor, Tensor, Tensor]:
+        """
+            Run the five modality subnets, overlapping them on separate CUDA
+            streams when the inputs live on the GPU - the subnets have no data
+            dependency on each other so their kernels can interleave
+
+            :param context_x: A tensor representing the context feature
+            :param speaker_x: A tensor representing the speaker feature
+            :param audio_x: A tensor representing the audio modality
+            :param video_x: A tensor representing the video modality
+            :param text_x: A tensor representing the textual modality
+
+            :return: The hidden representation of each modality
+        """
+        subnet_inputs = [
+            (self.video_subnet, video_x),
+            (self.audio_subnet, audio_x),
+            (self.text_subnet, text_x),
+            (self.speaker_subnet, speaker_x),
+            (self.context_subnet, context_x),
+        ]
+
+        if not text_x.is_cuda:
+            return tuple(subnet(x) for subnet, x in subnet_inputs)
+
+        if self._streams is None:
+            self._streams = [torch.cuda.Stream() for _ in range(len(subnet_inputs))]
+
+        current = torch.cuda.current_stream()
+        hidden = []
+        for stream, (subnet, x) in zip(self._streams, subnet_inputs):
+            stream.wait_stream(current)
+            with torch.cuda.stream(stream):
+                hidden.append(subnet(x))
+
+        for stream in self._streams:
+            current.wait_stream(stream)
+
+        return tuple(hidden)
+
+    def forward(self, text_x: Tensor, video_x: Tensor, audio_x: Tensor, speaker_x: Tensor, context_x: Tensor) -> Tensor:
+        """
+            Read the bert text embeddings
+
+            :param context_x: A tensor representing the context feature
+            :param speaker_x: A tensor representing the speaker feature
+            :param audio_x: A tensor representing the audio modality
+            :param video_x: A tensor representing the video modality
+            :param text_x: A tensor representing the textual modality
+
+            :return: A tensor containing the output of the model
+        """
+        # Run the matmuls in BF16 on GPU to engage Tensor Cores and halve
+        # weight/activation bandwidth; the logits go back to FP32 for the loss
+        with torch.autocast(device_type='cuda', dtype=torch.bfloat16, enabled=text_x.is_cuda):
+            video_h, audio_h, text_h, speaker_h, context_h = self._run_subnets(
+                text_x, video_x, audio_x, speaker_x, context_x)
+
+            fusion_h = self.fusion(text_h, audio_h, video_h)
+
+            p = self.post_fusion_dropout.p
+
+            # The scalar modality weights commute with dropout, so instead of
+            # scaling the full activations they scale the matching columns of
+            # post_fusion_layer_1's weight - one small mul over the weight
+            # matrix instead of three passes over the batch
+            scale = self.fusion.scale_vector(text_h.shape[-1], audio_h.shape[-1], video_h.shape[-1])
+            x = _drop_linear_relu(fusion_h, p, self.training,
+                                  self.post_fusion_layer_1.weight * scale,
+                                  self.post_fusion_layer_1.bias)
+
+            x = _drop_linear_relu(x, p, self.training,
+                                  self.post_fusion_layer_2.weight, self.post_fusion_layer_2.bias)
+
+            x = _drop_add3_linear_relu(x, speaker_h, context_h, p, self.training,
+                                       self.post_fusion_layer_3.weight, self.post_fusion_layer_3.bias,
+                                       self.post_fusion_layer_3_speaker.weight,
+                                       self.post_fusion_layer_3_context.weight)
+
+            out = _drop_linear(x, p, self.training, self.fc.weight, self.fc.bias)
+
+        return out.float()
+
+    def to_inference(self) -> torch.jit.ScriptModule:
+        """
+            Produce an inference-only TorchScript copy of the network - the
+            training forward (CUDA streams, autocast, compiled wrapper) is
+            not scriptable, so the network is first rebuilt as an
+            InferenceNetwork of plain module calls with the dropouts and
+            norms already folded away, and optimize_for_inference then fuses
+            the remaining Linear + ReLU pairs
+
+            :return: A frozen ScriptModule for inference
+        """
+        return torch.jit.optimize_for_inference(torch.jit.script(InferenceNetwork(self)))
+
+    def to_quantized(self) -> nn.Module:
+        """
+            Produce a dynamically quantized copy of the model for CPU
+            inference - the network is first rebuilt as an InferenceNetwork
+            whose forward calls its nn.Linear modules directly (the training
+            forward reads raw weight tensors, which a DynamicQuantizedLinear
+            does not expose) and moved to the CPU, where the dynamic INT8
+            kernels live, then every linear becomes an INT8
+            DynamicQuantizedLinear, halving weight memory and using fbgemm's
+            VNNI dot-product kernels on x86. No retraining is needed;
+            activations are quantized on the fly per batch
+
+            :return: The INT8-quantized model
+        """
+        return torch.quantization.quantize_dynamic(InferenceNetwork(self).cpu(), {nn.Linear}, dtype=torch.qint8)
+
+    def export_tensorrt(self, sample_inputs: Tuple[Tensor, Tensor, Tensor, Tensor, Tensor], path: str) -> str:
+        """
+            Export the trained network to a TensorRT engine for inference -
+            the traceable InferenceNetwork copy is exported so the ONNX graph
+            is plain FP32 module calls with no autocast casts or cached
+            fixed-size buffers, and TensorRT fuses the Linear + ReLU chains
+            into single FP16 kernels
+
+            :param sample_inputs: Example (text, video, audio, speaker, context) tensors used to trace the export
+            :param path: Path to save the TensorRT engine to
+
+            :return: Path of the saved engine
+        """
+        input_names = ['text_x', 'video_x', 'audio_x', 'speaker_x', 'context_x']
+        onnx_path = path + '.onnx'
+
+        torch.onnx.export(InferenceNetwork(self), sample_inputs, onnx_path,
+                          input_names=input_names, output_names=['logits'],
+                          dynamic_axes={name: {0: 'batch'} for name in input_names + ['logits']})
+
+        subprocess.run(['trtexec', f'--onnx={onnx_path}', '--fp16', f'--saveEngine={path}'], check=True)
+        return path
+
+
+class InferenceNetwork(nn.Module):
+    """
+        Produce an eval-only copy of a trained fusion network built from
+        plain module calls - no dropout, CUDA streams, autocast or compiled
+        wrappers - so it can be scripted, dynamically quantized or traced
+        for export while matching the trained network's eval outputs
+    """
+
+    def __init__(self, network: "WeightedMultiModalFusionNetwork") -> None:
+        """
+            Initializes internal InferenceNetwork state from a trained network
+
+            :param network: The trained WeightedMultiModalFusionNetwork to copy
+        """
+        super(InferenceNetwork, self).__init__()
+
+        self.video_subnet = network.video_subnet.to_inference_mlp()
+        self.audio_subnet = network.audio_subnet.to_inference_mlp()
+        self.text_subnet = network.text_subnet.to_inference_mlp()
+        self.context_subnet = network.context_subnet.to_inference_mlp()
+        self.speaker_subnet = network.speaker_subnet.to_inference_mlp()
+
+        pf1 = network.post_fusion_layer_1
+        self.post_fusion_layer_1 = nn.Linear(pf1.in_features, pf1.out_features,
+                                             device=pf1.weight.device, dtype=pf1.weight.dtype)
+        with torch.no_grad():
+            # Bake the modality scalars into the columns of the first
+            # post-fusion linear, exactly as the trained forward applies them
+            scale = network.fusion.scale_vector(config.TEXT_HIDDEN, config.AUDIO_HIDDEN, config.VIDEO_HIDDEN)
+            self.post_fusion_layer_1.weight.copy_(pf1.weight * scale)
+            self.post_fusion_layer_1.bias.copy_(pf1.bias)
+
+        self.post_fusion_layer_2 = copy.deepcopy(network.post_fusion_layer_2)
+        self.post_fusion_layer_3 = copy.deepcopy(network.post_fusion_layer_3)
+        self.post_fusion_layer_3_speaker = copy.deepcopy(network.post_fusion_layer_3_speaker)
+        self.post_fusion_layer_3_context = copy.deepcopy(network.post_fusion_layer_3_context)
+        self.fc = copy.deepcopy(network.fc)
+
+        self.eval()
+
     def forward(self, text_x: Tensor, video_x: Tensor, audio_x: Tensor, speaker_x: Tensor, context_x: Tensor) -> Tensor:
         """
             Read the bert text embeddings
@@ -120,22 +586,55 @@ class WeightedMultiModalFusionNetwork(Classifier):
         speaker_h = self.speaker_subnet(speaker_x)
         context_h = self.context_subnet(context_x)
 
-        fusion_h = self.fusion(text_h, audio_h, video_h)
+        fusion_h = torch.cat([text_h, audio_h, video_h], -1)
 
-        x = self.post_fusion_dropout(fusion_h)
+        x = F.relu(self.post_fusion_layer_1(fusion_h))
+        x = F.relu(self.post_fusion_layer_2(x))
+        x = F.relu(self.post_fusion_layer_3(x)
+                   + self.post_fusion_layer_3_speaker(speaker_h)
+                   + self.post_fusion_layer_3_context(context_h))
+        return self.fc(x)
 
-        x = F.relu(self.post_fusion_layer_1(x), inplace=True)
 
-        x = self.post_fusion_dropout(x)
+class TensorRTClassifier:
+    """
+        Produce a wrapper that runs an exported ONNX model through
+        onnxruntime with the TensorRT execution provider
+        Attributes:
+            session - the onnxruntime inference session backed by TensorRT
+    """
 
-        x = F.relu(self.post_fusion_layer_2(x), inplace=True)
+    def __init__(self, onnx_path: str) -> None:
+        """
+            Initializes internal TensorRTClassifier state
 
-        late_fusion = torch.cat([x, speaker_h, context_h], dim=-1)
+            :param onnx_path: Path of the ONNX model written by export_tensorrt
+        """
+        import onnxruntime
 
-        x = self.post_fusion_dropout(late_fusion)
+        self.session = onnxruntime.InferenceSession(
+            onnx_path,
+            providers=['TensorrtExecutionProvider', 'CUDAExecutionProvider', 'CPUExecutionProvider'])
 
-        x = F.relu(self.post_fusion_layer_3(x), inplace=True)
+    def __call__(self, text_x: Tensor, video_x: Tensor, audio_x: Tensor,
+                 speaker_x: Tensor, context_x: Tensor) -> Tensor:
+        """
+            Run one inference forward through the TensorRT engine
 
-        x = self.post_fusion_dropout(x)
+            :param context_x: A tensor representing the context feature
+            :param speaker_x: A tensor representing the speaker feature
+            :param audio_x: A tensor representing the audio modality
+            :param video_x: A tensor representing the video modality
+            :param text_x: A tensor representing the textual modality
 
-        return self.fc(x)
+            :return: A tensor containing the output of the model
+        """
+        inputs = {
+            'text_x': text_x.cpu().numpy(),
+            'video_x': video_x.cpu().numpy(),
+            'audio_x': audio_x.cpu().numpy(),
+            'speaker_x': speaker_x.cpu().numpy(),
+            'context_x': context_x.cpu().numpy(),
+        }
+        logits = self.session.run(None, inputs)[0]
+        return torch.from_numpy(logits)
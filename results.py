@@ -1,3 +1,4 @@
+import sys
 from typing import Dict
 
 import numpy as np
@@ -14,6 +15,8 @@ class Result:
             f1_score - f1_score generated by classification report using test data
     """
 
+    __slots__ = ('best_acc', 'best_epoch', 'precision', 'recall', 'f1_score')
+
     def __init__(self, classification_report=None):
         self.best_acc = 0
         self.best_epoch = 0
@@ -45,14 +48,17 @@ class IterationResults:
 
     def __init__(self):
         self.fold_results = []
+        self._metric_sums = np.zeros(3)
 
     def add_result(self, result: Result) -> None:
         """
-        Add a result of a fold to the array
+        Add a result of a fold to the array, keeping running metric sums so
+        averaging later needs no pass over the folds
 
         :param result: Results for a certain fold to be added to iteration
         """
         self.fold_results.append(result)
+        self._metric_sums += (result.precision, result.recall, result.f1_score)
 
     def print_result(self) -> Dict[str, np.ndarray]:
         """
@@ -61,22 +67,24 @@ class IterationResults:
         :return: Dictionary of average precision, recall and f1_score for all folds in an iteration
         """
 
+        # Buffer the whole report and emit it with one write, instead of
+        # locking and flushing stdout several times per fold
+        lines = []
         for i, result in enumerate(self.fold_results):
-            print("Fold ", i + 1)
-            print("Weighted Precision: {}  Weighted Recall: {}  Weighted F score: {}".format(
+            lines.append(f"Fold  {i + 1}\n")
+            lines.append("Weighted Precision: {}  Weighted Recall: {}  Weighted F score: {}\n".format(
                 result.precision,
                 result.recall,
                 result.f1_score))
-            print(f'best_epoch:{result.best_epoch}, best_acc:{result.best_acc}')
+            lines.append(f'best_epoch:{result.best_epoch}, best_acc:{result.best_acc}\n')
 
-        avg_precision = np.mean([result.precision for result in self.fold_results])
-        avg_recall = np.mean([result.recall for result in self.fold_results])
-        avg_f1_score = np.mean([result.f1_score for result in self.fold_results])
+        avg_precision, avg_recall, avg_f1_score = self._metric_sums / len(self.fold_results)
 
-        print("#" * 20)
-        print("Avg :")
-        print("Weighted Precision: {:.3f}  Weighted Recall: {:.3f}  Weighted F score: {:.3f}".format(
+        lines.append("#" * 20 + "\n")
+        lines.append("Avg :\n")
+        lines.append("Weighted Precision: {:.3f}  Weighted Recall: {:.3f}  Weighted F score: {:.3f}\n".format(
             avg_precision, avg_recall, avg_f1_score))
+        sys.stdout.write("".join(lines))
 
         return {
             'precision': avg_precision,
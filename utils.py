@@ -4,6 +4,7 @@ from typing import List, Optional, Dict, Tuple, Any
 
 import numpy as np
 import torch
+import torch.distributed as dist
 from torch.nn import Module
 
 import config
@@ -86,6 +87,16 @@ def accuracy(output: np.numarray, labels: np.numarray) -> float:
     return (output.argmax(1) == torch.squeeze(labels.long())).sum().item()
 
 
+def is_main_process() -> bool:
+    """
+    Check whether this process is rank 0, or not running distributed at all -
+    used so only one process writes shared files under DDP
+
+    :return: True when this process should perform file writes
+    """
+    return not (dist.is_available() and dist.is_initialized()) or dist.get_rank() == 0
+
+
 class SaveBestModel:
     """
         Produce an object that stores the best epoch and accuracy for a certain model
@@ -107,8 +118,11 @@ class SaveBestModel:
         """
         if current_acc > self.acc:
             self.acc, self.epoch, self.model = current_acc, epoch, model
-            print(f"\nSaving best model for epoch: {epoch + 1}\n")
-            torch.save({
-                'epoch': epoch + 1,
-                'model_state_dict': model.state_dict(),
-            }, path)
+            # Under DDP every rank sees the same val metrics and would race
+            # to write the same file, so only rank 0 touches the checkpoint
+            if is_main_process():
+                print(f"\nSaving best model for epoch: {epoch + 1}\n")
+                torch.save({
+                    'epoch': epoch + 1,
+                    'model_state_dict': model.state_dict(),
+                }, path)